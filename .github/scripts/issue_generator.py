@@ -4,6 +4,7 @@ Handles formatting and template rendering for GitHub issues
 """
 import subprocess
 import re
+import traceback
 from pathlib import Path
 from typing import List, Sequence, Optional, Union
 
@@ -12,24 +13,31 @@ try:
 except ImportError:
     Github = None
 
+# Default template in .github/templates/ directory, resolved once at import
+DEFAULT_TEMPLATE_PATH = Path(__file__).resolve().parent.parent / 'templates' / 'issue_template.md'
+
 
 class IssueBodyGenerator:
     """Generate GitHub issue body from Jira data"""
     
+    # Template text keyed by path, shared across instances
+    _template_cache = {}
+    
     def __init__(self, template_path=None):
         """Initialize with optional custom template path"""
-        if template_path is None:
-            # Default template in .github/templates/ directory
-            template_path = Path(__file__).parent.parent / 'templates' / 'issue_template.md'
-        
-        self.template_path = Path(template_path)
+        self.template_path = DEFAULT_TEMPLATE_PATH if template_path is None else Path(template_path)
         self.template_content = self._load_template()
     
     def _load_template(self):
-        """Load template from file"""
+        """Load template from file (read once per path)"""
+        cache_key = str(self.template_path)
+        if cache_key in self._template_cache:
+            return self._template_cache[cache_key]
         try:
             with open(self.template_path, 'r', encoding='utf-8') as f:
-                return f.read()
+                content = f.read()
+            self._template_cache[cache_key] = content
+            return content
         except FileNotFoundError:
             print(f"❌ ERROR: Template not found: {self.template_path}")
             print(f"   Please ensure the template file exists in the templates folder.")
@@ -154,17 +162,17 @@ class IssueBodyGenerator:
         if not attachments:
             return ""
         
-        section = "\n## 📎 Attachments\n\n"
+        lines = ["\n## 📎 Attachments\n\n"]
         for att in attachments:
             size_kb = att['size'] / 1024
             file_icon = self._get_file_icon(att['filename'])
             
             if att.get('github_url'):
-                section += f"- {file_icon} **[{att['filename']}]({att['github_url']})** - {size_kb:.2f} KB\n"
+                lines.append(f"- {file_icon} **[{att['filename']}]({att['github_url']})** - {size_kb:.2f} KB\n")
             else:
-                section += f"- {file_icon} **{att['filename']}** - {size_kb:.2f} KB ⚠️ *Upload failed*\n"
+                lines.append(f"- {file_icon} **{att['filename']}** - {size_kb:.2f} KB ⚠️ *Upload failed*\n")
         
-        return section
+        return "".join(lines)
     
     def _get_file_icon(self, filename):
         """Get emoji icon based on file extension"""
@@ -249,7 +257,6 @@ def create_issue_with_gh(
             return issue
         except Exception:
             # Print full traceback for debugging
-            import traceback
             print("Failed to create issue via PyGithub (traceback follows):")
             traceback.print_exc()
             # fall through to CLI fallback
@@ -6,16 +6,20 @@ Runs entirely on GitHub Actions - No external servers needed!
 
 import os
 import sys
-import json
 import base64
-import urllib.request
-import urllib.error
+import re
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from github import Github
 from dotenv import load_dotenv
 from datetime import datetime
 from pathlib import Path
 from urllib.parse import quote
+from concurrent.futures import ThreadPoolExecutor
 import time
+import threading
+import traceback
 
 # Add parent directory to path to import from issue_creator
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
@@ -24,6 +28,10 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 from issue_generator import IssueBodyGenerator
 # Import the correct github client that doesn't strip assignees
 from issue_creator.github_client import create_issue_with_gh
+from issue_creator.ratelimit import request_with_backoff
+
+# Load .env once, before CONFIG and the methods below read the environment
+load_dotenv()
 
 # Configuration from GitHub Secrets
 CONFIG = {
@@ -34,6 +42,37 @@ CONFIG = {
     'GITHUB_REPOSITORY': os.environ.get('GITHUB_REPOSITORY')
 }
 
+# One pooled session for all Jira and GitHub REST calls so connections are reused.
+# Idempotent calls (Jira fetch, attachment downloads) also retry 429/5xx, waiting out
+# Retry-After; POSTs are left to request_with_backoff so nothing is created twice.
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=16,
+    # raise_on_status=False hands the last response back once retries run out, so the
+    # raise_for_status() handlers still report its status and body (not a RetryError)
+    max_retries=Retry(
+        total=5,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        raise_on_status=False,
+    ),
+))
+
+# Issue number at the end of an issue URL returned by the gh CLI
+ISSUE_URL_RE = re.compile(r'/issues/(\d+)')
+
+# Concurrent attachment downloads/uploads; kept small to respect Jira and GitHub rate limits
+MAX_PARALLEL_TRANSFERS = 4
+_PRINT_LOCK = threading.Lock()
+
+
+def _print_locked(*lines):
+    """Print from a transfer worker without interleaving with other workers' output"""
+    with _PRINT_LOCK:
+        for line in lines:
+            print(line)
+
 
 class JiraGitHubProcessor:
     """Main processor class"""
@@ -44,6 +83,11 @@ class JiraGitHubProcessor:
         self.attachments = []
         self.github_issue_number = None
         self.github_issue_url = None
+        # owner/repo is fixed for the run; build the REST base once
+        self.repo_api_url = f"https://api.github.com/repos/{CONFIG['GITHUB_REPOSITORY']}"
+        # Jira Basic Auth header, shared by the issue fetch, every attachment download and the comment
+        auth_string = f"{CONFIG['JIRA_EMAIL']}:{CONFIG['JIRA_API_TOKEN']}"
+        self.jira_auth_header = f"Basic {base64.b64encode(auth_string.encode('utf-8')).decode('utf-8')}"
         
     def run(self):
         """Main execution flow"""
@@ -87,7 +131,6 @@ class JiraGitHubProcessor:
             
         except Exception as e:
             print(f"❌ Error: {str(e)}", file=sys.stderr)
-            import traceback
             traceback.print_exc()
             return 1
     
@@ -97,25 +140,18 @@ class JiraGitHubProcessor:
         
         url = f"{CONFIG['JIRA_BASE_URL']}/rest/api/3/issue/{self.bug_key}"
         
-        # Create Basic Auth header
-        auth_string = f"{CONFIG['JIRA_EMAIL']}:{CONFIG['JIRA_API_TOKEN']}"
-        auth_bytes = base64.b64encode(auth_string.encode('utf-8'))
-        auth_header = f"Basic {auth_bytes.decode('utf-8')}"
-        
-        request = urllib.request.Request(url)
-        request.add_header('Authorization', auth_header)
-        request.add_header('Accept', 'application/json')
+        headers = {'Authorization': self.jira_auth_header, 'Accept': 'application/json'}
         
         try:
-            with urllib.request.urlopen(request, timeout=30) as response:
-                self.bug_data = json.loads(response.read().decode('utf-8'))
-                print(f"✅ Fetched bug: {self.bug_data['key']}")
-                print(f"   Summary: {self.bug_data['fields']['summary']}")
+            response = SESSION.get(url, headers=headers, timeout=30)
+            response.raise_for_status()
+            self.bug_data = response.json()
+            print(f"✅ Fetched bug: {self.bug_data['key']}")
+            print(f"   Summary: {self.bug_data['fields']['summary']}")
                 
-        except urllib.error.HTTPError as e:
-            print(f"❌ HTTP Error: {e.code} - {e.reason}")
-            error_body = e.read().decode('utf-8')
-            print(f"   Response: {error_body}")
+        except requests.HTTPError as e:
+            print(f"❌ HTTP Error: {e.response.status_code} - {e.response.reason}")
+            print(f"   Response: {e.response.text}")
             raise
     
     def process_attachments(self):
@@ -132,58 +168,54 @@ class JiraGitHubProcessor:
         attachments_dir = Path('attachments')
         attachments_dir.mkdir(exist_ok=True)
         
-        for attachment in attachments_data:
-            try:
-                filename = attachment['filename']
-                file_url = attachment['content']
-                file_size = attachment['size']
-                
-                print(f"   Downloading: {filename} ({self._format_size(file_size)})")
-                
-                # Download file
-                file_data = self._download_from_jira(file_url)
-                
-                # Save to disk
-                file_path = attachments_dir / filename
-                with open(file_path, 'wb') as f:
-                    f.write(file_data)
-                
-                self.attachments.append({
-                    'filename': filename,
-                    'path': str(file_path),
-                    'size': file_size,
-                    'mime_type': attachment.get('mimeType', 'application/octet-stream'),
-                    'github_url': None  # Will be set after upload
-                })
-                
-                print(f"   ✅ Downloaded: {filename}")
-                
-            except Exception as e:
-                print(f"   ⚠️  Failed to download {filename}: {str(e)}")
-                continue
+        # Download concurrently; map() keeps results in the original Jira order
+        with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_TRANSFERS, len(attachments_data))) as executor:
+            results = executor.map(lambda attachment: self._download_attachment(attachment, attachments_dir), attachments_data)
+            self.attachments.extend(result for result in results if result is not None)
         
         print(f"✅ Downloaded {len(self.attachments)} attachment(s)")
     
-    def _download_from_jira(self, url):
-        """Download file from Jira"""
-        auth_string = f"{CONFIG['JIRA_EMAIL']}:{CONFIG['JIRA_API_TOKEN']}"
-        auth_bytes = base64.b64encode(auth_string.encode('utf-8'))
-        auth_header = f"Basic {auth_bytes.decode('utf-8')}"
-        
-        request = urllib.request.Request(url)
-        request.add_header('Authorization', auth_header)
-        
-        with urllib.request.urlopen(request, timeout=60) as response:
-            return response.read()
+    def _download_attachment(self, attachment, attachments_dir):
+        """Download one Jira attachment to disk; returns its metadata or None on failure"""
+        filename = attachment.get('filename')
+        try:
+            file_url = attachment['content']
+            file_size = attachment['size']
+            
+            _print_locked(f"   Downloading: {filename} ({self._format_size(file_size)})")
+            
+            # Download file straight to disk; Jira allows duplicate filenames, so prefix
+            # the attachment id to keep concurrent downloads from sharing a path
+            file_path = attachments_dir / f"{attachment['id']}_{filename}"
+            self._download_from_jira(file_url, file_path)
+            
+            _print_locked(f"   ✅ Downloaded: {filename}")
+            return {
+                'filename': filename,
+                'path': str(file_path),
+                'size': file_size,
+                'mime_type': attachment.get('mimeType', 'application/octet-stream'),
+                'github_url': None  # Will be set after upload
+            }
+            
+        except Exception as e:
+            _print_locked(f"   ⚠️  Failed to download {filename}: {str(e)}")
+            return None
+    
+    def _download_from_jira(self, url, file_path):
+        """Download file from Jira, streaming it to file_path in chunks"""
+        with SESSION.get(url, headers={'Authorization': self.jira_auth_header}, timeout=60, stream=True) as response:
+            response.raise_for_status()
+            with open(file_path, 'wb') as f:
+                for chunk in response.iter_content(chunk_size=1024 * 1024):
+                    f.write(chunk)
     
     def upload_to_github_release(self):
         """Upload attachments to GitHub Release"""
         print(f"📦 Creating GitHub Release for attachments...")
         
-        owner, repo = CONFIG['GITHUB_REPOSITORY'].split('/')
-        
         # Create release
-        release_url = f"https://api.github.com/repos/{owner}/{repo}/releases"
+        release_url = f"{self.repo_api_url}/releases"
         release_tag = f"jira-{self.bug_key.lower()}-{int(time.time())}"
         
         release_data = {
@@ -194,37 +226,33 @@ class JiraGitHubProcessor:
             'prerelease': True
         }
         
-        request = urllib.request.Request(
-            release_url,
-            data=json.dumps(release_data).encode('utf-8'),
-            method='POST'
-        )
-        request.add_header('Authorization', f"Bearer {CONFIG['GITHUB_TOKEN']}")
-        request.add_header('Accept', 'application/vnd.github+json')
-        request.add_header('Content-Type', 'application/json')
-        request.add_header('X-GitHub-Api-Version', '2022-11-28')
+        headers = {
+            'Authorization': f"Bearer {CONFIG['GITHUB_TOKEN']}",
+            'Accept': 'application/vnd.github+json',
+            'X-GitHub-Api-Version': '2022-11-28',
+        }
         
         try:
-            with urllib.request.urlopen(request, timeout=30) as response:
-                release = json.loads(response.read().decode('utf-8'))
-                upload_url = release['upload_url'].replace('{?name,label}', '')
-                
-                print(f"✅ Release created: {release_tag}")
-                print(f"   Upload URL: {upload_url}")
-                
-                # Upload each attachment
-                for attachment in self.attachments:
-                    self._upload_asset(upload_url, attachment)
+            response = request_with_backoff(SESSION, 'POST', release_url, json=release_data, headers=headers, timeout=30)
+            response.raise_for_status()
+            release = response.json()
+            upload_url = release['upload_url'].replace('{?name,label}', '')
+            
+            print(f"✅ Release created: {release_tag}")
+            print(f"   Upload URL: {upload_url}")
+            
+            # Upload attachments concurrently; each upload only touches its own attachment dict
+            with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_TRANSFERS, len(self.attachments))) as executor:
+                list(executor.map(lambda attachment: self._upload_asset(upload_url, attachment), self.attachments))
                     
-        except urllib.error.HTTPError as e:
+        except requests.HTTPError as e:
             try:
-                error_body = e.read().decode('utf-8')
-                error_data = json.loads(error_body)
-                error_msg = error_data.get('message', error_body)
+                error_data = e.response.json()
+                error_msg = error_data.get('message', e.response.text)
             except Exception:
-                error_msg = e.reason
+                error_msg = e.response.reason
             
-            print(f"⚠️  Failed to create release: {e.code} - {error_msg}")
+            print(f"⚠️  Failed to create release: {e.response.status_code} - {error_msg}")
             print(f"   Attachments will be listed in issue without download links")
         except Exception as e:
             print(f"⚠️  Unexpected error creating release: {str(e)}")            
@@ -233,52 +261,54 @@ class JiraGitHubProcessor:
 
     def _upload_asset(self, upload_url, attachment):
         """Upload single file as release asset"""
-        print(f"   Uploading: {attachment['filename']} ({self._format_size(attachment['size'])})")
+        _print_locked(f"   Uploading: {attachment['filename']} ({self._format_size(attachment['size'])})")
 
-        try:
-            with open(attachment['path'], 'rb') as f:
-                file_data = f.read()
-        except Exception as e:
-            print(f"   ⚠️  Failed to read file {attachment['filename']}: {str(e)}")
-            return
-            
         # URL-encode the filename (spaces/special chars)
         safe_name = quote(attachment['filename'], safe='')
         asset_url = f"{upload_url}?name={safe_name}"
 
-        request = urllib.request.Request(asset_url, data=file_data, method='POST')
-        request.add_header('Authorization', f"Bearer {CONFIG['GITHUB_TOKEN']}")
-        request.add_header('Accept', 'application/vnd.github+json')
-        request.add_header('Content-Type', attachment.get('mime_type', 'application/octet-stream'))
-        request.add_header('Content-Length', str(len(file_data)))
-        request.add_header('X-GitHub-Api-Version', '2022-11-28')
+        headers = {
+            'Authorization': f"Bearer {CONFIG['GITHUB_TOKEN']}",
+            'Accept': 'application/vnd.github+json',
+            'Content-Type': attachment.get('mime_type', 'application/octet-stream'),
+            'X-GitHub-Api-Version': '2022-11-28',
+        }
+
+        try:
+            # Stream the file body from disk instead of reading it into memory
+            with open(attachment['path'], 'rb') as f:
+                response = SESSION.post(asset_url, data=f, headers=headers, timeout=120)
+        except requests.RequestException as e:
+            _print_locked(f"   ⚠️  Unexpected error uploading {attachment['filename']}: {str(e)}")
+            return
+        except OSError as e:
+            _print_locked(f"   ⚠️  Failed to read file {attachment['filename']}: {str(e)}")
+            return
 
         try:
-            with urllib.request.urlopen(request, timeout=120) as response:
-                asset = json.loads(response.read().decode('utf-8'))
-                attachment['github_url'] = asset.get('browser_download_url')
-                print(f"   ✅ Uploaded: {attachment['filename']}")
-                print(f"      URL: {attachment['github_url']}")
-        except urllib.error.HTTPError as e:
+            response.raise_for_status()
+            asset = response.json()
+            attachment['github_url'] = asset.get('browser_download_url')
+            _print_locked(f"   ✅ Uploaded: {attachment['filename']}", f"      URL: {attachment['github_url']}")
+        except requests.HTTPError as e:
             # Print the response body to help troubleshooting
             try:
-                body = e.read().decode('utf-8')
-                error_data = json.loads(body)
-                error_msg = error_data.get('message', body)
+                error_data = e.response.json()
+                error_msg = error_data.get('message', e.response.text)
             except Exception:
-                body = '<no body>'
-            error_msg = e.reason
+                error_msg = e.response.reason
+            status = e.response.status_code
             
-            print(f"   ⚠️  Failed to upload {attachment['filename']}: {e.code} - {error_msg}")
-            if e.code == 403:
-                print(f"      Hint: Check that workflow has 'contents: write' permission")
-            elif e.code == 422:
-                print(f"      Hint: Asset might already exist or filename is invalid")
+            lines = [f"   ⚠️  Failed to upload {attachment['filename']}: {status} - {error_msg}"]
+            if status == 403:
+                lines.append(f"      Hint: Check that workflow has 'contents: write' permission")
+            elif status == 422:
+                lines.append(f"      Hint: Asset might already exist or filename is invalid")
+            _print_locked(*lines)
         except Exception as e:
-            print(f"   ⚠️  Unexpected error uploading {attachment['filename']}: {str(e)}")
+            _print_locked(f"   ⚠️  Unexpected error uploading {attachment['filename']}: {str(e)}")
 
     def create_github_issue11(self):
-        load_dotenv()
         jira_issue_key = 'Bug'
         jira_summary = 'Summary'
         
@@ -286,8 +316,6 @@ class JiraGitHubProcessor:
         print("🔨 Creating GitHub issue11...")
         token = os.getenv("GH_PAT_AGENT")
         repo_name = os.getenv("GITHUB_REPOSITORY")
-        print("GH_PAT_AGENT environment variable value "+ token)
-        print("GITHUB_REPOSITORY environment variable value "+ repo_name)
         
         if not token:
             print("Error: GH_PAT_AGENT environment variable not set")
@@ -317,6 +345,7 @@ class JiraGitHubProcessor:
             labels=labels,
             gh_token=token,
             repo_obj=repo,
+            repo_full_name=repo_name,
         )
         
         # Store the created issue information
@@ -329,8 +358,7 @@ class JiraGitHubProcessor:
             # Got URL string from CLI
             self.github_issue_url = created
             # Extract issue number from URL
-            import re
-            match = re.search(r'/issues/(\d+)', created)
+            match = ISSUE_URL_RE.search(created)
             if match:
                 self.github_issue_number = int(match.group(1))
             print(f"✅ Issue created: {self.github_issue_url}")
@@ -364,8 +392,7 @@ class JiraGitHubProcessor:
         labels = fields.get('labels', [])
         
         # Prepare API request
-        owner, repo = CONFIG['GITHUB_REPOSITORY'].split('/')
-        url = f"https://api.github.com/repos/{owner}/{repo}/issues"
+        url = f"{self.repo_api_url}/issues"
         
         issue_labels = ['jira-bug', 'automated']
         
@@ -391,58 +418,49 @@ class JiraGitHubProcessor:
             # 'assignees': ['copilot-swe-agent']  # Assign to GitHub Copilot hrutvipujar-sudo
         }
         
-        request = urllib.request.Request(
-            url,
-            data=json.dumps(issue_data).encode('utf-8'),
-            method='POST'
-        )
-        request.add_header('Authorization', f"Bearer {CONFIG['GITHUB_TOKEN']}")
-        request.add_header('Accept', 'application/vnd.github+json')
-        request.add_header('Content-Type', 'application/json')
+        headers = {
+            'Authorization': f"Bearer {CONFIG['GITHUB_TOKEN']}",
+            'Accept': 'application/vnd.github+json',
+        }
         
         try:
-            with urllib.request.urlopen(request, timeout=30) as response:
-                result = json.loads(response.read().decode('utf-8'))
-                self.github_issue_number = result['number']
-                self.github_issue_url = result['html_url']
-                print(f"✅ Created GitHub issue #{self.github_issue_number}")
-                print(f"   URL: {self.github_issue_url}")
+            response = request_with_backoff(SESSION, 'POST', url, json=issue_data, headers=headers, timeout=30)
+            response.raise_for_status()
+            result = response.json()
+            self.github_issue_number = result['number']
+            self.github_issue_url = result['html_url']
+            print(f"✅ Created GitHub issue #{self.github_issue_number}")
+            print(f"   URL: {self.github_issue_url}")
                 
-        except urllib.error.HTTPError as e:
-            print(f"❌ Failed to create GitHub issue: {e.code} - {e.reason}")
-            print(f"   Response: {e.read().decode('utf-8')}")
+        except requests.HTTPError as e:
+            print(f"❌ Failed to create GitHub issue: {e.response.status_code} - {e.response.reason}")
+            print(f"   Response: {e.response.text}")
             raise
     
     def assign_copilot_to_issue(self):
         """Assign GitHub Copilot to the created issue"""
         print("🤖 Assigning Copilot to the issue...")
         
-        owner, repo = CONFIG['GITHUB_REPOSITORY'].split('/')
-        url = f"https://api.github.com/repos/{owner}/{repo}/issues/{self.github_issue_number}/assignees"
+        url = f"{self.repo_api_url}/issues/{self.github_issue_number}/assignees"
         
         # Assign with optional agent assignment parameters
         assignee_data = {
             'assignees': ['copilot-swe-agent[bot]']
         }
         
-        request = urllib.request.Request(
-            url,
-            data=json.dumps(assignee_data).encode('utf-8'),
-            method='POST'
-        )
-        request.add_header('Authorization', f"Bearer {CONFIG['GITHUB_TOKEN']}")
-        request.add_header('Accept', 'application/vnd.github+json')
-        request.add_header('Content-Type', 'application/json')
-        request.add_header('X-GitHub-Api-Version', '2022-11-28')
+        headers = {
+            'Authorization': f"Bearer {CONFIG['GITHUB_TOKEN']}",
+            'Accept': 'application/vnd.github+json',
+            'X-GitHub-Api-Version': '2022-11-28',
+        }
         
         try:
-            with urllib.request.urlopen(request, timeout=30) as response:
-                result = json.loads(response.read().decode('utf-8'))
-                print(f"✅ Assigned Copilot to issue #{self.github_issue_number}")
-        except urllib.error.HTTPError as e:
-            error_body = e.read().decode('utf-8')
-            print(f"⚠️  Failed to assign Copilot: {e.code} - {e.reason}")
-            print(f"   Response: {error_body}")
+            response = request_with_backoff(SESSION, 'POST', url, json=assignee_data, headers=headers, timeout=30)
+            response.raise_for_status()
+            print(f"✅ Assigned Copilot to issue #{self.github_issue_number}")
+        except requests.HTTPError as e:
+            print(f"⚠️  Failed to assign Copilot: {e.response.status_code} - {e.response.reason}")
+            print(f"   Response: {e.response.text}")
             # Don't raise - this is optional
     
     def update_jira(self):
@@ -481,24 +499,13 @@ class JiraGitHubProcessor:
             }
         }
         
-        auth_string = f"{CONFIG['JIRA_EMAIL']}:{CONFIG['JIRA_API_TOKEN']}"
-        auth_bytes = base64.b64encode(auth_string.encode('utf-8'))
-        auth_header = f"Basic {auth_bytes.decode('utf-8')}"
-        
-        request = urllib.request.Request(
-            url,
-            data=json.dumps(comment_data).encode('utf-8'),
-            method='POST'
-        )
-        request.add_header('Authorization', auth_header)
-        request.add_header('Content-Type', 'application/json')
-        
         try:
-            with urllib.request.urlopen(request, timeout=30) as response:
-                print(f"✅ Updated Jira with GitHub link")
+            response = SESSION.post(url, json=comment_data, headers={'Authorization': self.jira_auth_header}, timeout=30)
+            response.raise_for_status()
+            print(f"✅ Updated Jira with GitHub link")
                 
-        except urllib.error.HTTPError as e:
-            print(f"⚠️  Failed to update Jira: {e.code} - {e.reason}")
+        except requests.HTTPError as e:
+            print(f"⚠️  Failed to update Jira: {e.response.status_code} - {e.response.reason}")
     
     @staticmethod
     def _format_size(size_bytes):
@@ -1,7 +1,12 @@
 import subprocess
 import re
+import traceback
 from typing import List, Sequence, Optional, Union
 import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from .ratelimit import TokenBucket, request_with_backoff
 
 # Optional import for PyGithub usage
 try:
@@ -11,6 +16,22 @@ except Exception:
     Github = None
     Issue = None
 
+GITHUB_API_URL = "https://api.github.com"
+
+# At most one issue created per second process-wide, to stay under GitHub's secondary rate limit
+ISSUE_CREATE_LIMITER = TokenBucket(rate=1.0, burst=1)
+
+# Shared session so raw REST calls reuse keep-alive connections. Every call
+# on it is a POST, which urllib3 never retries on status, so only failed
+# connection attempts are retried here; rate limits go through request_with_backoff
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(max_retries=Retry(total=3, backoff_factor=0.5)))
+
+# Result of `gh auth status`, checked at most once per process
+_GH_AUTH_OK: Optional[bool] = None
+# Issue URL printed by `gh issue create`
+_ISSUE_URL_RE = re.compile(r"https?://github\.com/[^\s]+/issues/\d+")
+
 
 def severity_label(cvss_raw) -> str:
     try:
@@ -25,6 +46,14 @@ def severity_label(cvss_raw) -> str:
         return "severity:medium"
     return "severity:low"
 
+def _ensure_gh_auth() -> bool:
+    """Return whether the gh CLI is authenticated, running `gh auth status` only once."""
+    global _GH_AUTH_OK
+    if _GH_AUTH_OK is None:
+        auth_check = subprocess.run(["gh", "auth", "status"], capture_output=True, text=True)
+        _GH_AUTH_OK = auth_check.returncode == 0
+    return _GH_AUTH_OK
+
 def build_issue_labels(vuln: pd.Series, extra_labels: Sequence[str]) -> List[str]:
     labels: List[str] = list(extra_labels) if extra_labels else []
     labels.append("vulnerability")
@@ -37,6 +66,48 @@ def build_issue_labels(vuln: pd.Series, extra_labels: Sequence[str]) -> List[str
             seen.add(label)
     return deduped
 
+def _create_issue_rest(
+    token: str,
+    repo_full_name: str,
+    title: str,
+    body: str,
+    labels: Optional[Sequence[str]],
+    assignees: Optional[Sequence[str]],
+) -> Optional[dict]:
+    """POST /repos/{repo}/issues over the shared session; returns the issue JSON or None on failure."""
+    payload: dict = {"title": title, "body": body}
+    if labels:
+        payload["labels"] = list(labels)
+    if assignees:
+        payload["assignees"] = list(assignees)
+    try:
+        resp = request_with_backoff(
+            _SESSION,
+            "POST",
+            f"{GITHUB_API_URL}/repos/{repo_full_name}/issues",
+            json=payload,
+            headers={"Authorization": f"Bearer {token}", "Accept": "application/vnd.github+json"},
+            timeout=30,
+        )
+    except requests.RequestException as exc:
+        print(f"Failed to create issue via REST: {title} ({exc})")
+        return None
+    if resp.status_code != 201:
+        print(f"Failed to create issue via REST: {title} (status={resp.status_code}, body={resp.text})")
+        return None
+    return resp.json()
+
+def _normalize_assignees(assignees) -> Optional[List[str]]:
+    """Normalize assignees into either None or a list[str] with no empty values."""
+    if not assignees:
+        return None
+    if isinstance(assignees, (list, tuple)):
+        normalized = [str(a).strip() for a in assignees if a is not None and str(a).strip() != ""]
+    else:
+        # single scalar value
+        normalized = [str(assignees).strip()] if str(assignees).strip() != "" else []
+    return normalized or None
+
 def create_issue_with_gh(
     title: str,
     body: str,
@@ -44,31 +115,33 @@ def create_issue_with_gh(
     labels: Optional[Sequence[str]] = None,
     gh_token: Optional[str] = None,
     repo_obj: Optional[object] = None,
+    repo_full_name: Optional[str] = None,
 ) -> Union[bool, "Issue", str, None]:
     """
     Create a GitHub issue.
 
+    Uses PyGithub when ``repo_obj`` is given and PyGithub is installed.
+    Otherwise a direct REST call is made when both ``gh_token`` and
+    ``repo_full_name`` are passed. The gh CLI is the fallback for either. REST is never tried after a PyGithub
+    failure: a timeout or 5xx may already have created the issue, and a
+    second POST would duplicate it.
+
     Returns:
       - PyGithub Issue object on success when using PyGithub
-      - issue URL (string) on success when using gh CLI and URL can be parsed
+      - issue URL (string) on success when using REST, or gh CLI and URL can be parsed
       - True on success when using gh CLI but no URL parsed
       - False or None on failure
     """
+    # One token per logical issue, whichever path below ends up creating it
+    ISSUE_CREATE_LIMITER.acquire()
+
     # Try PyGithub path if repo_obj is provided (preferred for programmatic access)
     if repo_obj is not None and Github is not None:
         try:
-            # Normalize assignees into either None or a list[str] with no empty values
-            normalized_assignees = None
-            if assignees:
-                if isinstance(assignees, (list, tuple)):
-                    normalized_assignees = [str(a).strip() for a in assignees if a is not None and str(a).strip() != ""]
-                else:
-                    # single scalar value
-                    normalized_assignees = [str(assignees).strip()] if str(assignees).strip() != "" else None
-                if normalized_assignees == []:
-                    normalized_assignees = None
+            normalized_assignees = _normalize_assignees(assignees)
 
             print(f"Attempting PyGithub create_issue: title={title!r}, assignees={normalized_assignees}, labels={labels}")
+            # PyGithub 2.x retries rate limits and 5xx itself (GithubRetry)
             issue = repo_obj.create_issue(
                 title=title,
                 body=body,
@@ -79,14 +152,17 @@ def create_issue_with_gh(
             return issue
         except Exception:
             # Print full traceback for debugging
-            import traceback
             print("Failed to create issue via PyGithub (traceback follows):")
             traceback.print_exc()
             # fall through to CLI fallback
+    elif gh_token and repo_full_name:
+        created = _create_issue_rest(gh_token, repo_full_name, title, body, labels, _normalize_assignees(assignees))
+        if created:
+            print(f"Created issue via REST: {title} (#{created['number']})")
+            return created["html_url"]
 
     # Fallback: use gh CLI (keeps previous behavior)
-    auth_check = subprocess.run(["gh", "auth", "status"], capture_output=True, text=True)
-    if auth_check.returncode != 0:
+    if not _ensure_gh_auth():
         print("gh CLI not authenticated. Ensure 'gh auth login --with-token' was run.")
         return False
 
@@ -108,7 +184,7 @@ def create_issue_with_gh(
         print(f"Created issue via gh: {title}")
         print(stdout)
         # Attempt to parse an issue URL from stdout
-        m = re.search(r"https?://github\.com/[^\s]+/issues/\d+", stdout)
+        m = _ISSUE_URL_RE.search(stdout)
         if m:
             return m.group(0)
         return True
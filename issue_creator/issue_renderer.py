@@ -1,29 +1,52 @@
 from pathlib import Path
-from .utils import SafeDict, sanitize
+from string import Formatter
+from .utils import make_context, sanitize
 
-_TEMPLATE_CACHE: str | None = None
 JIRA_TEMPLATE_PATH = Path(__file__).resolve().parent / "templates" / "jira_issue_prompt.md"
 
+def _parse_template(text: str) -> list[tuple[str, str | None]]:
+    """Split a template into (literal text, field name or None) chunks.
+
+    Only bare ``{identifier}`` fields are supported; a conversion (``!r``), a
+    format spec (``:>5``) or an attribute/index/positional field raises
+    ValueError instead of being silently rendered differently from str.format.
+    """
+    parsed = []
+    for literal, field, spec, conversion in Formatter().parse(text):
+        if field is not None and (spec or conversion or not field.isidentifier()):
+            raise ValueError(f"unsupported template field {field!r}: only bare {{name}} fields are allowed")
+        parsed.append((literal, field))
+    return parsed
+
+def _compile_template(text: str) -> tuple[str, tuple[str, ...]]:
+    """Turn a str.format template into a %-format string plus its field order."""
+    parsed = _parse_template(text)
+    fmt = "".join(literal.replace("%", "%%") + ("%s" if field is not None else "") for literal, field in parsed)
+    return fmt, tuple(field for _, field in parsed if field is not None)
+
+# Loaded and compiled once at import; no per-call filesystem access or parsing
+_JIRA_FORMAT, _JIRA_FIELDS = _compile_template(JIRA_TEMPLATE_PATH.read_text(encoding="utf-8"))
+
 def render_issue_from_jira(jira_issue_key: str, jira_summary: str, jira_description: str) -> str:
     """Render an improved, bug-focused issue body from Jira inputs.
 
     This function requires the external template file at:
       issue_creator/templates/jira_issue_prompt.md
 
-    The template is loaded and formatted with the sanitized inputs. If the file is
-    missing this function will raise a FileNotFoundError so callers are aware the
-    template must be present.
+    The template is read and compiled to a %-format string once when this
+    module is imported, so rendering is a single C-level formatting pass.
+    Only fields the template references are sanitized; any other field
+    renders as "N/A". If the file is missing the import raises a
+    FileNotFoundError so callers are aware the template must be present.
     """
-    # sanitize inputs
-    jira_issue_key = sanitize(jira_issue_key or "UNKNOWN")
-    jira_summary = sanitize(jira_summary or "No summary provided")
-    jira_description = sanitize(jira_description or "No description provided")
-
-    context = SafeDict(
-        jira_issue_key=jira_issue_key,
-        jira_summary=jira_summary,
-        jira_description=jira_description,
-    )
-
-    # Load external template (no fallback)
-    return JIRA_TEMPLATE_PATH.read_text(encoding="utf-8").format_map(context)
+    raw = {
+        "jira_issue_key": jira_issue_key or "UNKNOWN",
+        "jira_summary": jira_summary or "No summary provided",
+        "jira_description": jira_description or "No description provided",
+    }
+
+    context = make_context()
+    for field in _JIRA_FIELDS:
+        if field not in context and field in raw:
+            context[field] = sanitize(raw[field])
+    return _JIRA_FORMAT % tuple(context[field] for field in _JIRA_FIELDS)
@@ -0,0 +1,110 @@
+import random
+import threading
+import time
+from typing import Mapping, Optional
+
+MAX_RETRIES = 5
+MAX_BACKOFF_SECONDS = 60
+# Below this many remaining requests, pace calls out over the rest of the rate-limit window
+LOW_REMAINING_THRESHOLD = 100
+
+# Rate-limit headers of the last non-rate-limited GitHub response, paced off by the next request
+_last_quota_headers: Optional[Mapping[str, str]] = None
+
+
+class TokenBucket:
+    """Thread-safe token bucket; acquire() blocks until a token is available."""
+
+    def __init__(self, rate: float = 1.0, burst: int = 1):
+        self.rate = rate
+        self.capacity = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+def _lower_headers(headers: Optional[Mapping[str, str]]) -> dict:
+    return {key.lower(): value for key, value in (headers or {}).items()}
+
+
+def is_rate_limited(status: int, headers: Optional[Mapping[str, str]], message: str = "") -> bool:
+    """Whether a 403/429 response is a (primary or secondary) rate limit rather than a permission error."""
+    if status == 429:
+        return True
+    if status != 403:
+        return False
+    headers = _lower_headers(headers)
+    return (
+        "retry-after" in headers
+        or headers.get("x-ratelimit-remaining") == "0"
+        or "rate limit" in message.lower()
+    )
+
+
+def retry_delay(headers: Optional[Mapping[str, str]], attempt: int) -> float:
+    """Seconds to wait before retry ``attempt``: Retry-After, then the rate-limit reset, then jittered backoff.
+
+    Header-driven waits are capped at MAX_BACKOFF_SECONDS, so a reset an hour
+    away cannot stall the run past the workflow timeout.
+    """
+    headers = _lower_headers(headers)
+    retry_after = headers.get("retry-after")
+    if retry_after:
+        try:
+            return min(MAX_BACKOFF_SECONDS, max(0.0, float(retry_after)))
+        except ValueError:
+            # HTTP-date form; fall through to the reset header or backoff
+            pass
+    reset = headers.get("x-ratelimit-reset")
+    if reset and headers.get("x-ratelimit-remaining") == "0":
+        return min(MAX_BACKOFF_SECONDS, max(0.0, float(reset) - time.time()))
+    return min(MAX_BACKOFF_SECONDS, 2 ** attempt) + random.random()
+
+
+def throttle_from_headers(headers: Optional[Mapping[str, str]], low_water: int = LOW_REMAINING_THRESHOLD) -> float:
+    """Sleep when the quota reported in ``headers`` is nearly spent; returns the delay, at most MAX_BACKOFF_SECONDS."""
+    headers = _lower_headers(headers)
+    delay = 0.0
+    remaining = headers.get("x-ratelimit-remaining")
+    reset = headers.get("x-ratelimit-reset")
+    if remaining is not None and reset and int(remaining) < low_water:
+        # Spread what is left of the quota evenly over the rest of the window
+        delay = min(MAX_BACKOFF_SECONDS, max(0.0, float(reset) - time.time()) / (int(remaining) + 1))
+    if delay > 0:
+        print(f"GitHub rate limit nearly exhausted; pausing {delay:.1f}s")
+        time.sleep(delay)
+    return delay
+
+
+def request_with_backoff(session, method: str, url: str, **kwargs):
+    """Send a request through ``session``, retrying up to MAX_RETRIES times while GitHub rate limits it.
+
+    Before sending, pace off the quota the previous GitHub response reported,
+    so no time is spent after the last call of a run. Only the raw requests
+    paths need this; PyGithub 2.x already retries rate limits with its
+    default GithubRetry.
+    """
+    global _last_quota_headers
+    throttle_from_headers(_last_quota_headers)
+    for attempt in range(MAX_RETRIES + 1):
+        resp = session.request(method, url, **kwargs)
+        limited = is_rate_limited(resp.status_code, resp.headers, resp.text)
+        if not limited:
+            _last_quota_headers = resp.headers
+        if attempt == MAX_RETRIES or not limited:
+            return resp
+        delay = retry_delay(resp.headers, attempt)
+        print(f"GitHub rate limit hit (status={resp.status_code}); retrying in {delay:.1f}s")
+        time.sleep(delay)
@@ -1,10 +1,25 @@
+from collections import defaultdict
 import pandas as pd
 
-class SafeDict(dict):
-    def __missing__(self, key):
-        return "N/A"
+_NA = "N/A"
 
-def sanitize(value):
-    if pd.isna(value) or value in ("", None):
-        return "N/A"
-    return value
\ No newline at end of file
+def make_context(**kwargs) -> defaultdict:
+    """Template context where any missing field renders as "N/A"."""
+    context = defaultdict(lambda: _NA)
+    context.update(kwargs)
+    return context
+
+def sanitize(value, _isna=pd.isna):
+    # Plain str/int/float values are the common case; only fall through to
+    # pd.isna for anything else (pd.NA, NaT, numpy scalars, ...).
+    if isinstance(value, str):
+        return value if value else _NA
+    if value is None:
+        return _NA
+    if type(value) is int:
+        return value
+    if type(value) is float:
+        return _NA if value != value else value
+    if _isna(value):
+        return _NA
+    return value
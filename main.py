@@ -2,20 +2,12 @@
 import argparse
 import os
 import sys
-import glob
-import time
-import requests
-import base64
-import json
 from dotenv import load_dotenv
-from github import Github
-from github.GithubException import GithubException
-from issue_creator.issue_renderer import render_issue_from_jira
-from issue_creator.github_client import build_issue_labels, create_issue_with_gh
+# PyGithub and issue_creator (which pulls in pandas/requests) are imported inside
+# the functions that use them, so --help and DRY_RUN never pay for loading them
 
-# Use a single attachments branch for all issues; each issue will have its own folder under attachments/
-ATTACHMENTS_BRANCH = os.getenv("ATTACHMENTS_BRANCH", "issue-attachments").strip()
-target_instance = os.getenv("TARGET_INSTANCE", "brand_landscape_analyzer").strip().lower()
+# Load .env once, before create_issue_from_jira reads the environment
+load_dotenv()
 
 def parse_args():
     parser = argparse.ArgumentParser(
@@ -26,6 +18,8 @@ def parse_args():
     return parser.parse_args()
 
 def ensure_repo(token: str, repo_name: str):
+    from github import Github
+
     try:
         gh = Github(token)
         repo = gh.get_repo(repo_name)
@@ -36,6 +30,8 @@ def ensure_repo(token: str, repo_name: str):
         sys.exit(1)
 
 def validate_assignees(repo, gh, assignees):
+    from github.GithubException import GithubException
+
     valid, invalid = [], []
     for username in assignees:
         try:
@@ -57,15 +53,12 @@ def validate_assignees(repo, gh, assignees):
         print(f"Warning: These assignees are not assignable and will be skipped: {invalid}")
     return valid
     
-def create_issue_from_jira():
+def create_issue_from_jira(dry_run: bool = False):
     """Create a GitHub issue from Jira environment variables."""
-    load_dotenv()
-    
     jira_issue_key = os.getenv("JIRA_ISSUE_KEY")
     jira_summary = os.getenv("JIRA_SUMMARY")
-    jira_attachments = os.getenv("JIRA_ATTACHMENTS", "")
     jira_description = os.getenv("JIRA_DESCRIPTION", "")
-    dry_run = os.getenv("DRY_RUN", "false").lower() == "true"
+    dry_run = dry_run or os.getenv("DRY_RUN", "false").lower() == "true"
     # labels = os.getenv("LABEL")
     
     if not jira_issue_key:
@@ -85,10 +78,11 @@ def create_issue_from_jira():
         print(f"  Summary: {jira_summary}")
         return
     
+    from issue_creator.issue_renderer import render_issue_from_jira
+    from issue_creator.github_client import create_issue_with_gh
+
     token = os.getenv("GH_PAT_AGENT")
     repo_name = os.getenv("GITHUB_REPOSITORY")
-    print("GH_PAT_AGENT environment variable value "+ token)
-    print("GITHUB_REPOSITORY environment variable value "+ repo_name)
     
     if not token:
         print("Error: GH_PAT_AGENT environment variable not set")
@@ -119,6 +113,7 @@ def create_issue_from_jira():
         labels=labels,
         gh_token=token,
         repo_obj=repo,
+        repo_full_name=repo_name,
     )
 
 
@@ -126,7 +121,7 @@ def main():
     args = parse_args()
     
     if args.from_jira:
-        create_issue_from_jira()
+        create_issue_from_jira(dry_run=args.dry_run)
         return
 
 if __name__ == "__main__":
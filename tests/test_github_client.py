@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Tests for the issue-creation dispatch in issue_creator.github_client.
+
+PyGithub's repository, the shared HTTP session and the gh CLI are all
+replaced with fakes, so nothing here touches the network or spawns gh.
+"""
+
+import subprocess
+from types import SimpleNamespace
+
+import pytest
+
+from issue_creator import github_client, ratelimit
+
+ISSUE_URL = "https://github.com/octo/repo/issues/7"
+
+
+class FakeRepo:
+    """Stands in for a PyGithub Repository; create_issue returns an issue or raises."""
+
+    def __init__(self, error=None):
+        self.error = error
+        self.calls = []
+
+    def create_issue(self, **kwargs):
+        self.calls.append(kwargs)
+        if self.error:
+            raise self.error
+        return SimpleNamespace(number=7, html_url=ISSUE_URL)
+
+
+class FakeResponse:
+    def __init__(self, status_code, payload=None, text=""):
+        self.status_code = status_code
+        self.headers = {}
+        self.text = text
+        self._payload = payload
+
+    def json(self):
+        return self._payload
+
+
+class FakeSession:
+    """Returns the scripted responses in order and records each request."""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def request(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+        return self.responses.pop(0)
+
+
+@pytest.fixture
+def gh_cli(monkeypatch):
+    """Fake an authenticated gh CLI; returns the list of commands it was asked to run."""
+    commands = []
+
+    def fake_run(cmd, **kwargs):
+        commands.append(cmd)
+        return subprocess.CompletedProcess(cmd, 0, stdout=f"{ISSUE_URL}\n", stderr="")
+
+    monkeypatch.setattr(github_client, "_ensure_gh_auth", lambda: True)
+    monkeypatch.setattr(github_client.subprocess, "run", fake_run)
+    monkeypatch.setattr(github_client, "ISSUE_CREATE_LIMITER", SimpleNamespace(acquire=lambda: None))
+    # Pretend PyGithub is installed, and start without pacing carried over from other tests
+    monkeypatch.setattr(github_client, "Github", object)
+    monkeypatch.setattr(ratelimit, "_last_quota_headers", None)
+    return commands
+
+
+def use_session(monkeypatch, responses):
+    session = FakeSession(responses)
+    monkeypatch.setattr(github_client, "_SESSION", session)
+    return session
+
+
+def test_pygithub_success_skips_rest_and_cli(monkeypatch, gh_cli):
+    session = use_session(monkeypatch, [])
+    repo = FakeRepo()
+
+    created = github_client.create_issue_with_gh(
+        "Title", "Body", ["alice", ""], labels=["bug"],
+        gh_token="token", repo_obj=repo, repo_full_name="octo/repo",
+    )
+
+    assert created.number == 7
+    assert repo.calls == [{"title": "Title", "body": "Body", "assignees": ["alice"], "labels": ["bug"]}]
+    assert session.calls == []
+    assert gh_cli == []
+
+
+def test_pygithub_failure_goes_to_cli_without_a_second_post(monkeypatch, gh_cli):
+    """A failed PyGithub create may still have created the issue, so REST is not retried."""
+    session = use_session(monkeypatch, [FakeResponse(201, {"number": 8, "html_url": "unused"})])
+
+    created = github_client.create_issue_with_gh(
+        "Title", "Body", [], gh_token="token",
+        repo_obj=FakeRepo(error=TimeoutError("read timed out")), repo_full_name="octo/repo",
+    )
+
+    assert created == ISSUE_URL
+    assert session.calls == []
+    assert len(gh_cli) == 1 and gh_cli[0][:3] == ["gh", "issue", "create"]
+
+
+def test_rest_without_repo_obj_returns_html_url(monkeypatch, gh_cli):
+    session = use_session(monkeypatch, [FakeResponse(201, {"number": 9, "html_url": ISSUE_URL})])
+
+    created = github_client.create_issue_with_gh(
+        "Title", "Body", "alice", labels=["bug"], gh_token="token", repo_full_name="octo/repo",
+    )
+
+    assert created == ISSUE_URL
+    assert gh_cli == []
+    ((method, url, kwargs),) = session.calls
+    assert (method, url) == ("POST", "https://api.github.com/repos/octo/repo/issues")
+    assert kwargs["json"] == {"title": "Title", "body": "Body", "labels": ["bug"], "assignees": ["alice"]}
+    assert kwargs["headers"]["Authorization"] == "Bearer token"
+
+
+def test_rest_failure_falls_through_to_cli(monkeypatch, gh_cli):
+    session = use_session(monkeypatch, [FakeResponse(422, text="Validation Failed")])
+
+    created = github_client.create_issue_with_gh(
+        "Title", "Body", [], labels=["bug"], gh_token="token", repo_full_name="octo/repo",
+    )
+
+    assert created == ISSUE_URL
+    assert len(session.calls) == 1
+    assert gh_cli == [["gh", "issue", "create", "--title", "Title", "--body", "Body", "--label", "bug"]]
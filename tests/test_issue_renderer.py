@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Tests for the precompiled Jira issue template in issue_creator.issue_renderer.
+
+The renderer turns the str.format template into a %-format string at import;
+these tests pin its output to what str.format_map would produce.
+"""
+
+import pytest
+
+from issue_creator.issue_renderer import (
+    JIRA_TEMPLATE_PATH,
+    _compile_template,
+    render_issue_from_jira,
+)
+from issue_creator.utils import make_context, sanitize
+
+
+@pytest.mark.parametrize("key,summary,description", [
+    ("PROJ-123", "Login fails with 100% CPU", "Steps:\n1. open {page}\n2. see %s in logs"),
+    ("", "", ""),
+])
+def test_render_matches_format_map_on_shipped_template(key, summary, description):
+    """Rendering the shipped template must match str.format_map over the same context."""
+    raw = {
+        "jira_issue_key": key or "UNKNOWN",
+        "jira_summary": summary or "No summary provided",
+        "jira_description": description or "No description provided",
+    }
+    context = make_context(**{name: sanitize(value) for name, value in raw.items()})
+    expected = JIRA_TEMPLATE_PATH.read_text(encoding="utf-8").format_map(context)
+
+    assert render_issue_from_jira(key, summary, description) == expected
+
+
+def test_compile_template_escapes_percent_and_keeps_field_order():
+    fmt, fields = _compile_template("50% of {a}, {{literal}}, then {b} and {a}")
+
+    assert fields == ("a", "b", "a")
+    assert fmt % ("x", "y", "x") == "50% of x, {literal}, then y and x"
+
+
+@pytest.mark.parametrize("template", [
+    "{name!r}",
+    "{name:>5}",
+    "{name.attr}",
+    "{name[0]}",
+    "{}",
+    "{0}",
+])
+def test_compile_template_rejects_unsupported_fields(template):
+    """Conversions, format specs and non-identifier fields are errors, not silently dropped."""
+    with pytest.raises(ValueError):
+        _compile_template(template)
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Tests for the GitHub rate-limit helpers in issue_creator.ratelimit.
+
+Time is faked through the module's ``time`` reference, so nothing here
+actually sleeps, and HTTP goes to a scripted fake session.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from issue_creator import ratelimit
+
+
+class FakeClock:
+    """Stands in for the time module: sleep() advances both clocks and is recorded."""
+
+    def __init__(self, wall=1_000_000.0):
+        self.now = 0.0
+        self.wall = wall
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def time(self):
+        return self.wall
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+        self.wall += seconds
+
+
+class FakeResponse:
+    def __init__(self, status_code, headers=None, text=""):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.text = text
+
+
+class FakeSession:
+    """Returns the scripted responses in order and records each request."""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def request(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+        return self.responses.pop(0)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(ratelimit, "time", fake)
+    # Make the backoff jitter deterministic
+    monkeypatch.setattr(ratelimit, "random", SimpleNamespace(random=lambda: 0.0))
+    # Start every test without quota headers left over from an earlier request
+    monkeypatch.setattr(ratelimit, "_last_quota_headers", None)
+    return fake
+
+
+def test_token_bucket_allows_burst_then_paces(clock):
+    """A full bucket hands out `burst` tokens at once, then one per 1/rate seconds."""
+    bucket = ratelimit.TokenBucket(rate=2.0, burst=2)
+
+    bucket.acquire()
+    bucket.acquire()
+    assert clock.sleeps == []
+
+    bucket.acquire()
+    assert clock.sleeps == [pytest.approx(0.5)]
+
+
+def test_token_bucket_refills_while_idle(clock):
+    """Tokens accrue while idle, but never beyond the bucket capacity."""
+    bucket = ratelimit.TokenBucket(rate=1.0, burst=1)
+    bucket.acquire()
+
+    clock.now += 10.0
+    bucket.acquire()
+    assert clock.sleeps == []
+
+    bucket.acquire()
+    assert clock.sleeps == [pytest.approx(1.0)]
+
+
+@pytest.mark.parametrize("status,headers,message,expected", [
+    (429, {}, "", True),
+    (403, {"Retry-After": "30"}, "", True),
+    (403, {"X-RateLimit-Remaining": "0"}, "", True),
+    (403, {}, "You have exceeded a secondary rate limit", True),
+    (403, {"X-RateLimit-Remaining": "4999"}, "Resource not accessible by integration", False),
+    (404, {"Retry-After": "30"}, "", False),
+    (201, {}, "", False),
+])
+def test_is_rate_limited(status, headers, message, expected):
+    """Only 429s and 403s carrying rate-limit signals count as rate limits."""
+    assert ratelimit.is_rate_limited(status, headers, message) is expected
+
+
+def test_retry_delay_prefers_retry_after(clock):
+    headers = {"Retry-After": "7", "X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(clock.wall + 100)}
+    assert ratelimit.retry_delay(headers, attempt=3) == 7.0
+
+
+def test_retry_delay_waits_for_reset_when_quota_is_spent(clock):
+    headers = {"x-ratelimit-remaining": "0", "x-ratelimit-reset": str(clock.wall + 42)}
+    assert ratelimit.retry_delay(headers, attempt=0) == pytest.approx(42.0)
+
+
+@pytest.mark.parametrize("headers", [
+    {"Retry-After": "3600"},
+    {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1003600"},
+])
+def test_retry_delay_caps_header_waits(clock, headers):
+    """A long Retry-After or a far-off reset is clamped rather than waited out in full."""
+    assert ratelimit.retry_delay(headers, attempt=0) == ratelimit.MAX_BACKOFF_SECONDS
+
+
+def test_retry_delay_ignores_http_date_retry_after(clock):
+    headers = {"Retry-After": "Wed, 21 Oct 2026 07:28:00 GMT"}
+    assert ratelimit.retry_delay(headers, attempt=2) == 4.0
+
+
+def test_retry_delay_falls_back_to_capped_exponential_backoff(clock):
+    assert ratelimit.retry_delay({}, attempt=0) == 1.0
+    assert ratelimit.retry_delay({}, attempt=3) == 8.0
+    assert ratelimit.retry_delay({}, attempt=10) == ratelimit.MAX_BACKOFF_SECONDS
+
+
+@pytest.mark.parametrize("remaining,reset_in,expected", [
+    ("9", 100, 10.0),
+    ("1", 3600, ratelimit.MAX_BACKOFF_SECONDS),
+    ("4999", 3600, 0.0),
+])
+def test_throttle_from_headers_spreads_low_quota_with_a_cap(clock, remaining, reset_in, expected):
+    """Below the low-water mark the rest of the window is split per request, never beyond the cap."""
+    headers = {"X-RateLimit-Remaining": remaining, "X-RateLimit-Reset": str(clock.wall + reset_in)}
+
+    assert ratelimit.throttle_from_headers(headers) == pytest.approx(expected)
+    assert clock.sleeps == ([pytest.approx(expected)] if expected else [])
+
+
+def test_request_with_backoff_paces_before_the_next_request_only(clock):
+    """A nearly spent quota delays the following request, not the return of the current one."""
+    low = {"X-RateLimit-Remaining": "4", "X-RateLimit-Reset": str(clock.wall + 50)}
+    session = FakeSession([FakeResponse(201, low), FakeResponse(201)])
+
+    ratelimit.request_with_backoff(session, "POST", "https://api.github.com/x")
+    assert clock.sleeps == []
+
+    ratelimit.request_with_backoff(session, "POST", "https://api.github.com/x")
+    assert clock.sleeps == [pytest.approx(10.0)]
+    assert len(session.calls) == 2
+
+
+def test_request_with_backoff_retries_rate_limits_then_returns(clock):
+    """Rate-limited responses are waited out and the request is re-sent unchanged."""
+    session = FakeSession([
+        FakeResponse(429, {"Retry-After": "3"}),
+        FakeResponse(403, {}, "secondary rate limit"),
+        FakeResponse(201),
+    ])
+
+    resp = ratelimit.request_with_backoff(session, "POST", "https://api.github.com/x", json={"a": 1})
+
+    assert resp.status_code == 201
+    assert clock.sleeps == [3.0, 2.0]
+    assert [call[0] for call in session.calls] == ["POST"] * 3
+    assert all(call[2] == {"json": {"a": 1}} for call in session.calls)
+
+
+def test_request_with_backoff_returns_other_errors_immediately(clock):
+    session = FakeSession([FakeResponse(422, {}, "Validation Failed")])
+
+    resp = ratelimit.request_with_backoff(session, "POST", "https://api.github.com/x")
+
+    assert resp.status_code == 422
+    assert clock.sleeps == []
+    assert len(session.calls) == 1
+
+
+def test_request_with_backoff_gives_up_after_max_retries(clock):
+    """After MAX_RETRIES retries the last rate-limited response is returned as-is."""
+    session = FakeSession([FakeResponse(429) for _ in range(ratelimit.MAX_RETRIES + 1)])
+
+    resp = ratelimit.request_with_backoff(session, "GET", "https://api.github.com/x")
+
+    assert resp.status_code == 429
+    assert len(session.calls) == ratelimit.MAX_RETRIES + 1
+    assert len(clock.sleeps) == ratelimit.MAX_RETRIES